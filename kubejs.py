@@ -1,77 +1,172 @@
 #!/usr/bin/env python3
+import atexit
+import bisect
+import difflib
+import gzip
 import json
 import os
 import argparse
+import queue
+import re
+import select
 import time
-import urllib.request
-import html.parser
 import logging
+import mmap
 import sys
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
-# Custom HTML Parser to replace BeautifulSoup
-class KubeJSAddonParser(html.parser.HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.addons = []
-        self.in_main = False
-        self.current_tag = None
-        self.current_attrs = None
-        self.current_data = ""
-
-    def handle_starttag(self, tag, attrs):
-        self.current_tag = tag
-        self.current_attrs = dict(attrs)
-
-        # Check if we're entering the main content
-        if tag == 'main':
-            self.in_main = True
-
-        # If we're in the main content and find an 'a' tag, check if it's an addon link
-        if self.in_main and tag == 'a' and 'href' in dict(attrs):
-            self.current_data = ""  # Reset data for this tag
-
-    def handle_endtag(self, tag):
-        # If we're ending an 'a' tag and we're in the main content
-        if self.in_main and tag == 'a' and self.current_tag == 'a' and 'href' in self.current_attrs:
-            href = self.current_attrs['href']
-            name = self.current_data.strip()
-
-            # Check if this is an addon link
-            if href and name and '/wiki/addons/' in href:
-                self.addons.append({
-                    'name': name,
-                    'url': f"https://kubejs.com{href}" if href.startswith('/') else href
-                })
+# orjson is optional; when available it serializes several times faster than
+# the standard library. Everything still works without it.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes for on-disk storage."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson's fast path when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes for human-facing files."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Encoders bound once and reused by the display and indexing paths, instead
+# of rebuilding encoder state on every json.dumps(..., indent=4) call.
+_pretty_encode = json.JSONEncoder(indent=4, ensure_ascii=False).encode
+_compact_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+# Addon link extraction to replace BeautifulSoup.
+# A compiled regex scan over the raw bytes is far cheaper than running a
+# pure-Python HTMLParser state machine over every character of the page.
+_ADDON_LINK_RE = re.compile(
+    rb'<a\b[^>]*\bhref="([^"]*/wiki/addons/[^"]*)"[^>]*>([^<]+)</a>',
+    re.IGNORECASE
+)
+_MAIN_TAG_RE = re.compile(rb'<main[\s>]', re.IGNORECASE)
+
+# Chunk size for streaming extraction, and the overlap kept between chunks
+# so an anchor tag spanning a chunk boundary is still matched.
+_EXTRACT_CHUNK_SIZE = 65536
+_EXTRACT_OVERLAP = 4096
+
+def _find_addon_links(html_content: bytes) -> List[Dict[str, str]]:
+    """Run the addon link regex over a chunk of HTML bytes."""
+    addons = []
+    # Bind the method once; LOAD_FAST beats a LOAD_ATTR per link
+    append = addons.append
+    for href_bytes, name_bytes in _ADDON_LINK_RE.findall(html_content):
+        href = href_bytes.decode('utf-8', 'replace')
+        name = name_bytes.decode('utf-8', 'replace').strip()
+        if href and name:
+            append({
+                'name': name,
+                'url': f"https://kubejs.com{href}" if href.startswith('/') else href
+            })
+    return addons
+
+def extract_addons(html_content: bytes) -> List[Dict[str, str]]:
+    """Extract addon links from the raw HTML of the addons wiki page.
+
+    Args:
+        html_content (bytes): The raw HTML of the page
+
+    Returns:
+        List[Dict[str, str]]: A list of dictionaries containing addon information
+    """
+    # Restrict the scan to the <main> content, like the old parser did
+    match = _MAIN_TAG_RE.search(html_content)
+    if match:
+        end = html_content.find(b'</main>', match.start())
+        html_content = html_content[match.start():end if end != -1 else len(html_content)]
+
+    return _find_addon_links(html_content)
 
-        # If we're ending the main tag
-        if tag == 'main':
-            self.in_main = False
+def extract_addons_from_stream(response) -> List[Dict[str, str]]:
+    """Extract addon links while reading the response in fixed-size chunks.
 
-        self.current_tag = None
-        self.current_attrs = None
+    Never materializes the whole page in memory: completed parts of the
+    buffer are scanned and discarded as they arrive, and once </main> has
+    been seen the rest of the body is drained without scanning so the
+    keep-alive connection stays reusable.
 
-    def handle_data(self, data):
-        # If we're in an 'a' tag in the main content, collect the text
-        if self.in_main and self.current_tag == 'a':
-            self.current_data += data
+    Args:
+        response: A file-like HTTP response yielding bytes from read()
+
+    Returns:
+        List[Dict[str, str]]: A list of dictionaries containing addon information
+    """
+    addons: List[Dict[str, str]] = []
+    buffer = b''
+    in_main = False
+    main_done = False
+    # Local bindings for names hit once per chunk
+    read = response.read
+    chunk_size = _EXTRACT_CHUNK_SIZE
+
+    while True:
+        chunk = read(chunk_size)
+
+        if main_done:
+            if not chunk:
+                break
+            continue  # Drain the remainder so the connection can be reused
+
+        buffer += chunk
+        if not in_main:
+            match = _MAIN_TAG_RE.search(buffer)
+            if match:
+                buffer = buffer[match.start():]
+                in_main = True
+            elif len(buffer) > _EXTRACT_OVERLAP:
+                buffer = buffer[-_EXTRACT_OVERLAP:]
+
+        if in_main:
+            end = buffer.find(b'</main>')
+            if end != -1:
+                addons.extend(_find_addon_links(buffer[:end]))
+                buffer = b''
+                main_done = True
+            else:
+                # Scan everything up to the last potential anchor start; the
+                # tail is kept so a link spanning the boundary still matches.
+                cut = buffer.rfind(b'<a')
+                if cut > 0:
+                    addons.extend(_find_addon_links(buffer[:cut]))
+                    buffer = buffer[cut:]
+
+        if not chunk:
+            if in_main and buffer:
+                addons.extend(_find_addon_links(buffer))
+            break
+
+    return addons
 
 # Configuration management
 CONFIG_FILE = 'config.json'
 
-# Initialize with basic logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Message describing where the configuration came from; logged once the
+# handlers exist. Logging is configured exactly once, from the loaded
+# config, instead of installing a throwaway handler chain at import time
+# and tearing it down again with force=True.
+_config_load_message = ""
 
 def load_config():
     """Load configuration from config.json or create with defaults if it doesn't exist."""
+    global _config_load_message
     default_config = {
         "paths": {
             "recipes_file": "recipes.json",
@@ -93,16 +188,19 @@ def load_config():
         if os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE, 'r') as f:
                 config = json.load(f)
-                logging.info(f"Configuration loaded from {CONFIG_FILE}")
+                _config_load_message = f"Configuration loaded from {CONFIG_FILE}"
                 return config
         else:
             with open(CONFIG_FILE, 'w') as f:
                 json.dump(default_config, f, indent=4)
-                logging.info(f"Created default configuration in {CONFIG_FILE}")
+                _config_load_message = f"Created default configuration in {CONFIG_FILE}"
                 return default_config
     except Exception as e:
-        logging.error(f"Error loading configuration: {str(e)}")
-        logging.info("Using default configuration")
+        # Logging is not configured yet on this path; install a minimal
+        # stderr handler so the failure is visible.
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        logging.error("Error loading configuration: %s", e)
+        _config_load_message = "Using default configuration"
         return default_config
 
 # Set up logging configuration from the config file
@@ -121,13 +219,16 @@ def setup_logging(config):
             logging.FileHandler(log_file),
             logging.StreamHandler(sys.stdout)
         ],
-        force=True  # Override the previous configuration
+        force=True  # Replace the fallback stderr handler if config loading failed
     )
     logging.info("Logging configured successfully")
 
-# Load configuration and setup logging
+# Load configuration and setup logging (the only handler installation on the
+# normal path), then report where the configuration came from
 config = load_config()
 setup_logging(config)
+if _config_load_message:
+    logging.info(_config_load_message)
 
 # Define the file paths from configuration
 RECIPES_FILE = config["paths"]["recipes_file"]
@@ -138,89 +239,138 @@ KUBEJS_ADDONS_URL = config["settings"]["kubejs_addons_url"]
 # Initialize the recipes dictionary
 recipes: Dict[str, Dict[str, Any]] = {}
 
+# Supported recipe types, shared by the CLI prompts and the GUI comboboxes
+# so every caller reuses one immutable object instead of re-listing them.
+# Interned so loaded recipes with these types share the constant objects.
+RECIPE_TYPES = tuple(sys.intern(s) for s in (
+    "shaped",
+    "shapeless",
+    "smithing",
+    "smelting",
+    "blasting",
+    "smoking",
+    "campfire_cooking",
+    "stonecutting",
+    "brewing",
+    "custom"
+))
+RECIPE_TYPES_SET = frozenset(RECIPE_TYPES)
+
+# Numbered menu of the types, rendered once for the CLI prompts
+_TYPE_PROMPT = '\n'.join(f"{i}. {rt}" for i, rt in enumerate(RECIPE_TYPES, 1))
+
+# Matches one comma-separated ingredient with surrounding whitespace already
+# trimmed, so parsing is a single findall instead of split + strip + filter
+_INGREDIENT_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+def parse_ingredients(ingredients_input: str) -> List[str]:
+    """Split a comma-separated ingredient string in one compiled-regex pass."""
+    return _INGREDIENT_RE.findall(ingredients_input)
+
 # Ensure the recipes file exists
 def ensure_recipes_file():
     """Create recipes file if it doesn't exist."""
-    if not os.path.exists(RECIPES_FILE):
-        try:
-            with open(RECIPES_FILE, 'w') as f:
-                json.dump({}, f)
-            logging.info(f"Created empty recipes file: {RECIPES_FILE}")
-        except Exception as e:
-            logging.error(f"Failed to create recipes file: {str(e)}")
+    try:
+        # Exclusive create: one syscall instead of an exists() check + open
+        with open(RECIPES_FILE, 'x') as f:
+            json.dump({}, f)
+        logging.info("Created empty recipes file: %s", RECIPES_FILE)
+    except FileExistsError:
+        pass
+    except Exception as e:
+        logging.error("Failed to create recipes file: %s", e)
 
 # Make sure the recipes file exists
 ensure_recipes_file()
 
-def save_addons_to_db(addons: List[Dict[str, str]]) -> bool:
+def save_addons_to_db(addons: List[Dict[str, str]], etag: Optional[str] = None,
+                      last_modified: Optional[str] = None) -> bool:
     """Save addons to the local database file.
 
     Args:
         addons (List[Dict[str, str]]): The list of addons to save
+        etag (Optional[str]): ETag header from the fetch, for revalidation
+        last_modified (Optional[str]): Last-Modified header from the fetch
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        # Create a database object with timestamp
+        # Create a database object with timestamp (epoch seconds, so the
+        # staleness check never has to parse an ISO string)
         db = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "addons": addons
         }
-
-        with open(ADDONS_DB_FILE, 'w') as file:
-            json.dump(db, file, indent=4)
-
-        logging.info(f"Saved {len(addons)} addons to local database.")
+        if etag:
+            db["etag"] = etag
+        if last_modified:
+            db["last_modified"] = last_modified
+
+        # Compact, gzipped bytes: this is a cache file nobody reads by hand,
+        # and JSON compresses well enough that the write is mostly smaller
+        # than the whitespace the old pretty-printed form spent on indent
+        with open(ADDONS_DB_FILE, 'wb') as file:
+            file.write(gzip.compress(dumps_compact(db), compresslevel=3))
+
+        logging.info("Saved %d addons to local database.", len(addons))
         return True
     except Exception as e:
-        logging.error(f"Error saving addons to database: {str(e)}")
+        logging.error("Error saving addons to database: %s", e)
         return False
 
-def load_addons_from_db() -> Tuple[List[Dict[str, str]], Optional[datetime]]:
+def load_addons_from_db() -> Tuple[List[Dict[str, str]], Optional[float],
+                                   Optional[str], Optional[str]]:
     """Load addons from the local database file.
 
     Returns:
-        Tuple[List[Dict[str, str]], Optional[datetime]]: A tuple containing:
+        A tuple containing:
             - List of addons
-            - Timestamp of the database (None if not available)
+            - Timestamp of the database in epoch seconds (None if not available)
+            - ETag of the cached page (None if not available)
+            - Last-Modified of the cached page (None if not available)
     """
     try:
-        if not os.path.exists(ADDONS_DB_FILE):
+        try:
+            with open(ADDONS_DB_FILE, 'rb') as file:
+                raw = file.read()
+            # Databases written before compression was added are plain JSON;
+            # the gzip magic bytes tell the two formats apart
+            if raw[:2] == b'\x1f\x8b':
+                raw = gzip.decompress(raw)
+            db = loads_json(raw)
+        except FileNotFoundError:
             logging.info("Addons database file not found.")
-            return [], None
-
-        with open(ADDONS_DB_FILE, 'r') as file:
-            db = json.load(file)
+            return [], None, None, None
 
         timestamp = None
         if "timestamp" in db:
-            try:
-                timestamp = datetime.fromisoformat(db["timestamp"])
-            except ValueError:
-                logging.warning("Invalid timestamp format in database.")
+            if isinstance(db["timestamp"], (int, float)):
+                timestamp = float(db["timestamp"])
+            else:
+                # Legacy databases stored an ISO-8601 string; convert once
+                try:
+                    timestamp = datetime.fromisoformat(db["timestamp"]).timestamp()
+                except ValueError:
+                    logging.warning("Invalid timestamp format in database.")
 
         addons = db.get("addons", [])
-        logging.info(f"Loaded {len(addons)} addons from local database.")
-        return addons, timestamp
+        logging.info("Loaded %d addons from local database.", len(addons))
+        return addons, timestamp, db.get("etag"), db.get("last_modified")
     except Exception as e:
-        logging.error(f"Error loading addons from database: {str(e)}")
-        return [], None
+        logging.error("Error loading addons from database: %s", e)
+        return [], None, None, None
 
-def is_db_outdated(timestamp: Optional[datetime]) -> bool:
+def is_db_outdated(timestamp: Optional[float]) -> bool:
     """Check if the database is outdated.
 
     Args:
-        timestamp (Optional[datetime]): The timestamp of the database
+        timestamp (Optional[float]): The timestamp of the database in epoch seconds
 
     Returns:
         bool: True if outdated or timestamp is None, False otherwise
     """
-    if timestamp is None:
-        return True
-
-    max_age = timedelta(days=DB_MAX_AGE_DAYS)
-    return datetime.now() - timestamp > max_age
+    return timestamp is None or (time.time() - timestamp) > DB_MAX_AGE_DAYS * 86400
 
 def get_fallback_addons() -> List[Dict[str, str]]:
     """Get a list of fallback addons when web fetch and database fail.
@@ -252,45 +402,133 @@ def get_fallback_addons() -> List[Dict[str, str]]:
         }
     ]
 
+# Keep-alive connections reused across fetches so repeated requests to the
+# same host skip the TCP+TLS handshake.
+_HTTP_CONNECTIONS: Dict[str, Any] = {}
+_HTTP_USER_AGENT = 'Mozilla/5.0 KubeJS Recipe Manager'  # Avoid 403 responses
+
+def http_get(url: str, headers: Optional[Dict[str, str]] = None,
+             timeout: int = 10, stream: bool = False) -> Tuple[int, Any, Any]:
+    """Perform a GET request, reusing a cached keep-alive connection.
+
+    Args:
+        url (str): The URL to fetch
+        headers (Optional[Dict[str, str]]): Extra request headers
+        timeout (int): Connection timeout in seconds
+        stream (bool): If True, return the unread response object instead of
+            the body so the caller can read it in chunks
+
+    Returns:
+        Tuple[int, Any, Any]: Status code, response headers, and either the
+            response body (bytes) or the response object when streaming
+    """
+    import http.client
+    import urllib.parse
+
+    parts = urllib.parse.urlsplit(url)
+    host = parts.netloc
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    request_headers = {'User-Agent': _HTTP_USER_AGENT}
+    if headers:
+        request_headers.update(headers)
+
+    for attempt in (1, 2):
+        connection = _HTTP_CONNECTIONS.get(host)
+        if connection is None:
+            if parts.scheme == 'https':
+                connection = http.client.HTTPSConnection(host, timeout=timeout)
+            else:
+                connection = http.client.HTTPConnection(host, timeout=timeout)
+            _HTTP_CONNECTIONS[host] = connection
+        try:
+            connection.request('GET', path, headers=request_headers)
+            response = connection.getresponse()
+            if stream:
+                return response.status, response.headers, response
+            body = response.read()
+            return response.status, response.headers, body
+        except (http.client.HTTPException, OSError):
+            # The cached connection may have gone stale; drop it and retry
+            # once on a fresh connection before giving up.
+            connection.close()
+            _HTTP_CONNECTIONS.pop(host, None)
+            if attempt == 2:
+                raise
+
+# In-process memo for fetch_kubejs_addons: repeated lookups within a short
+# window (e.g. reopening the addon picker) skip the database file entirely.
+_ADDONS_MEMO_TTL = 60.0
+_addons_memo: Optional[List[Dict[str, str]]] = None
+_addons_memo_time = 0.0
+
+def _invalidate_addons_memo() -> None:
+    """Drop the in-process addons memo so the next fetch hits the database."""
+    global _addons_memo
+    _addons_memo = None
+
 def fetch_kubejs_addons() -> List[Dict[str, str]]:
     """Fetch KubeJS addons from the wiki page or local database.
 
     Returns:
         List[Dict[str, str]]: A list of dictionaries containing addon information
     """
+    global _addons_memo, _addons_memo_time
+    if (_addons_memo is not None
+            and time.monotonic() - _addons_memo_time < _ADDONS_MEMO_TTL):
+        return _addons_memo
+    addons = _fetch_kubejs_addons()
+    _addons_memo = addons
+    _addons_memo_time = time.monotonic()
+    return addons
+
+def _fetch_kubejs_addons() -> List[Dict[str, str]]:
+    """Resolve the addon list from the local database or the web."""
     # First try to load from local database
-    addons, timestamp = load_addons_from_db()
+    addons, timestamp, etag, last_modified = load_addons_from_db()
 
     # If database exists and is not outdated, use it
     if addons and not is_db_outdated(timestamp):
         logging.info("Using addons from local database.")
         return addons
 
-    # Otherwise, try to fetch from the web
+    # Otherwise, revalidate against the web. If we have cached addons with
+    # validators, issue a conditional GET so an unchanged page costs no
+    # body transfer and no parsing.
     logging.info("Fetching addons from the web...")
     try:
-        # Use urllib.request instead of requests
-        request = urllib.request.Request(
-            KUBEJS_ADDONS_URL,
-            headers={'User-Agent': 'Mozilla/5.0 KubeJS Recipe Manager'}  # Add user agent to avoid 403
-        )
-        
-        with urllib.request.urlopen(request, timeout=10) as response:
-            # Check if the response is successful (200 OK)
-            if response.status != 200:
-                raise Exception(f"HTTP Error: {response.status}")
+        conditional_headers = {}
+        if addons:
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+
+        status, response_headers, response = http_get(
+            KUBEJS_ADDONS_URL, headers=conditional_headers or None, stream=True)
+
+        if status == 304:
+            # Not modified: keep the cached addons and refresh the timestamp
+            response.read()
+            logging.info("Addons page unchanged (HTTP 304); using cached addons.")
+            save_addons_to_db(addons, etag=etag, last_modified=last_modified)
+            return addons
 
-            # Read and decode the response
-            html_content = response.read().decode('utf-8')
+        # Check if the response is successful (200 OK)
+        if status != 200:
+            response.read()  # Drain so the connection can be reused
+            raise Exception(f"HTTP Error: {status}")
 
-            # Use our custom parser instead of BeautifulSoup
-            parser = KubeJSAddonParser()
-            parser.feed(html_content)
-            web_addons = parser.addons
+        # Extract addon links while the body streams in
+        web_addons = extract_addons_from_stream(response)
 
         # If we got addons from the web, save them to the database
         if web_addons:
-            save_addons_to_db(web_addons)
+            save_addons_to_db(web_addons,
+                              etag=response_headers.get('ETag'),
+                              last_modified=response_headers.get('Last-Modified'))
             return web_addons
 
         # If web fetch produced no results but we have old addons, use them
@@ -303,7 +541,7 @@ def fetch_kubejs_addons() -> List[Dict[str, str]]:
         save_addons_to_db(fallback_addons)  # Save fallbacks to database for future use
         return fallback_addons
     except Exception as e:
-        logging.error(f"Error fetching KubeJS addons from web: {str(e)}")
+        logging.error("Error fetching KubeJS addons from web: %s", e)
         # If web fetch failed but we have old addons, use them
         if addons:
             logging.info("Using older addons from local database.")
@@ -343,69 +581,333 @@ def choose_recipe_type() -> Tuple[bool, Optional[Dict[str, str]]]:
 
         addon_choice = input(f"Enter addon number (1-{len(addons)}) or 0 to cancel: ").strip()
 
-        try:
-            addon_index = int(addon_choice) - 1
-            if addon_index == -1:  # User entered 0
-                print("Addon selection cancelled. Defaulting to normal recipe.")
-                return False, None
-            elif 0 <= addon_index < len(addons):
-                return True, addons[addon_index]
-            else:
-                print("Invalid selection. Defaulting to normal recipe.")
-                return False, None
-        except ValueError:
+        # isdigit check instead of int()/except: a plain branch is much
+        # cheaper than raising through the exception machinery on bad input
+        if not addon_choice.isdigit():
             print("Invalid input. Defaulting to normal recipe.")
             return False, None
+        addon_index = int(addon_choice) - 1
+        if addon_index == -1:  # User entered 0
+            print("Addon selection cancelled. Defaulting to normal recipe.")
+            return False, None
+        elif 0 <= addon_index < len(addons):
+            return True, addons[addon_index]
+        else:
+            print("Invalid selection. Defaulting to normal recipe.")
+            return False, None
     else:
         # Default to normal recipe for any input other than '2'
         return False, None
 
+# Precomputed lowercase search blobs keyed by recipe name. Maintained on
+# every mutation so searches never have to re-serialize recipes.
+_search_blobs: Dict[str, str] = {}
+
+# Recipe names kept in sorted order so list refreshes and prefix lookups
+# don't re-sort the full keyset on every call. Maintained alongside the
+# search blobs at the same mutation sites.
+_recipe_names_sorted: List[str] = []
+
+# Lazily filled cache of the indented JSON shown for each recipe, so
+# repeated views and searches don't re-serialize unchanged recipes
+_pretty_cache: Dict[str, str] = {}
+
+def _pretty_recipe(recipe_name: str) -> str:
+    """Return the indented JSON for a recipe, cached until the recipe changes."""
+    text = _pretty_cache.get(recipe_name)
+    if text is None:
+        text = _pretty_encode(recipes[recipe_name])
+        _pretty_cache[recipe_name] = text
+    return text
+
+# Same idea for the comma-joined ingredients line the edit form shows;
+# arrow-keying through the recipe list re-reads it on every selection
+_ingredients_joined_cache: Dict[str, str] = {}
+
+def _ingredients_joined(recipe_name: str) -> str:
+    """Return the recipe's ingredients joined for display, cached until changed."""
+    text = _ingredients_joined_cache.get(recipe_name)
+    if text is None:
+        text = ", ".join(recipes[recipe_name].get('ingredients', []))
+        _ingredients_joined_cache[recipe_name] = text
+    return text
+
+# Inverted token index over the search blobs: token -> recipe names.
+# An alphanumeric term is a substring of a blob exactly when it is a
+# substring of one of the blob's tokens, so whole-token queries can scan
+# the much smaller vocabulary instead of every blob.
+_TOKEN_RE = re.compile(r'[0-9a-z]+')
+_token_index: Dict[str, set] = {}
+
+def _index_tokens(recipe_name: str, blob: str) -> None:
+    """Add a recipe's blob tokens to the inverted index."""
+    for token in set(_TOKEN_RE.findall(blob)):
+        posting = _token_index.get(token)
+        if posting is None:
+            posting = _token_index[token] = set()
+        posting.add(recipe_name)
+
+def _unindex_tokens(recipe_name: str, blob: str) -> None:
+    """Remove a recipe's blob tokens from the inverted index."""
+    for token in set(_TOKEN_RE.findall(blob)):
+        posting = _token_index.get(token)
+        if posting is not None:
+            posting.discard(recipe_name)
+            if not posting:
+                del _token_index[token]
+
+# For large collections the per-blob loop is replaced by one C-level
+# str.find scan over all blobs joined with a NUL sentinel. The corpus is
+# rebuilt lazily on the first search after a mutation.
+_CORPUS_MIN_RECIPES = 2048
+_corpus = ""
+_corpus_starts: List[int] = []
+_corpus_names: List[str] = []
+_corpus_stale = True
+
+# True while the in-memory recipes differ from what is on disk
+_recipes_dirty = False
+
+def _mark_recipes_dirty() -> None:
+    """Record that the in-memory recipes need to be written to disk."""
+    global _recipes_dirty, _corpus_stale
+    _recipes_dirty = True
+    _corpus_stale = True
+
+def _build_search_corpus() -> None:
+    """Join the search blobs into one string with per-blob start offsets."""
+    global _corpus, _corpus_stale
+    _corpus_names.clear()
+    _corpus_starts.clear()
+    parts = []
+    position = 0
+    append_name = _corpus_names.append
+    append_start = _corpus_starts.append
+    append_part = parts.append
+    for recipe_name, blob in _search_blobs.items():
+        append_name(recipe_name)
+        append_start(position)
+        append_part(blob)
+        position += len(blob) + 1  # account for the joining sentinel
+    _corpus = '\x00'.join(parts)
+    _corpus_stale = False
+
+def _names_with_prefix(prefix: str) -> List[str]:
+    """Return recipe names starting with the prefix, via two bisects."""
+    if not prefix:
+        return _recipe_names_sorted
+    low = bisect.bisect_left(_recipe_names_sorted, prefix)
+    high = bisect.bisect_right(_recipe_names_sorted, prefix + '\uffff', low)
+    return _recipe_names_sorted[low:high]
+
+def _matching_recipe_names(search_term: str) -> List[str]:
+    """Return the names of recipes whose blob contains the search term."""
+    if len(_search_blobs) < _CORPUS_MIN_RECIPES:
+        return [name for name, blob in _search_blobs.items()
+                if search_term in blob]
+    if _corpus_stale:
+        _build_search_corpus()
+    matches = []
+    position = _corpus.find(search_term)
+    while position >= 0:
+        index = bisect.bisect_right(_corpus_starts, position) - 1
+        matches.append(_corpus_names[index])
+        # Resume the scan at the next blob so each recipe is reported once
+        next_start = (_corpus_starts[index + 1]
+                      if index + 1 < len(_corpus_starts) else len(_corpus))
+        position = _corpus.find(search_term, next_start)
+    return matches
+
+def _index_recipe(recipe_name: str, recipe: Dict[str, Any]) -> None:
+    """Update the search blob for a single recipe.
+
+    Every mutation site calls this (or _unindex_recipe), so it doubles as
+    the place where the dirty flag is raised.
+    """
+    old_blob = _search_blobs.get(recipe_name)
+    if old_blob is None:
+        bisect.insort(_recipe_names_sorted, recipe_name)
+    else:
+        _unindex_tokens(recipe_name, old_blob)
+    _pretty_cache.pop(recipe_name, None)
+    _ingredients_joined_cache.pop(recipe_name, None)
+    blob = (recipe_name + '\n' + _compact_encode(recipe)).lower()
+    _search_blobs[recipe_name] = blob
+    _index_tokens(recipe_name, blob)
+    _mark_recipes_dirty()
+
+def _unindex_recipe(recipe_name: str) -> None:
+    """Remove a recipe from the search blobs and the sorted name list."""
+    _pretty_cache.pop(recipe_name, None)
+    _ingredients_joined_cache.pop(recipe_name, None)
+    old_blob = _search_blobs.pop(recipe_name, None)
+    if old_blob is not None:
+        _unindex_tokens(recipe_name, old_blob)
+        index = bisect.bisect_left(_recipe_names_sorted, recipe_name)
+        if (index < len(_recipe_names_sorted)
+                and _recipe_names_sorted[index] == recipe_name):
+            _recipe_names_sorted.pop(index)
+    _mark_recipes_dirty()
+
+def _rebuild_search_index() -> None:
+    """Rebuild all search blobs from the in-memory recipes dict."""
+    global _recipes_dirty, _corpus_stale
+    _corpus_stale = True
+    _pretty_cache.clear()
+    _ingredients_joined_cache.clear()
+    _search_blobs.clear()
+    _token_index.clear()
+    for recipe_name, recipe in recipes.items():
+        blob = (recipe_name + '\n' + _compact_encode(recipe)).lower()
+        _search_blobs[recipe_name] = blob
+        _index_tokens(recipe_name, blob)
+    _recipe_names_sorted[:] = sorted(recipes)
+    # Rebuilding reflects what was just loaded from disk, so nothing is dirty
+    _recipes_dirty = False
+
+# st_mtime_ns of the recipes file as of the last load/save, used to skip
+# re-reading an unchanged file
+_recipes_mtime: Optional[int] = None
+
 def load_recipes() -> None:
-    """Load recipes from the JSON file."""
-    global recipes
+    """Load recipes from the JSON file.
+
+    Re-reading is skipped when the file has not changed since the last
+    load or save.
+    """
+    global recipes, _recipes_mtime, _recipes_dirty
     try:
-        if os.path.exists(RECIPES_FILE):
-            with open(RECIPES_FILE, 'r') as file:
-                recipes = json.load(file)
-            logging.info(f"Loaded {len(recipes)} recipes from {RECIPES_FILE}")
-        else:
-            logging.warning(f"Recipe file {RECIPES_FILE} not found. Creating empty recipe file.")
+        try:
+            with open(RECIPES_FILE, 'rb') as file:
+                mtime = os.fstat(file.fileno()).st_mtime_ns
+                if (_recipes_mtime is not None and mtime == _recipes_mtime
+                        and not _recipes_dirty):
+                    logging.info("Recipes file unchanged; keeping in-memory recipes.")
+                    return
+                # Parse straight from the page cache via mmap: with orjson
+                # the buffer is read in place, skipping the second copy of
+                # the file that read() would allocate
+                try:
+                    with mmap.mmap(file.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mapped:
+                        if ORJSON_AVAILABLE:
+                            view = memoryview(mapped)
+                            try:
+                                recipes = loads_json(view)
+                            finally:
+                                view.release()
+                        else:
+                            # stdlib json needs a real bytes object
+                            recipes = loads_json(mapped[:])
+                except (ValueError, OSError):
+                    # Empty file, or a platform where mmap on this handle
+                    # fails; fall back to a plain read
+                    file.seek(0)
+                    recipes = loads_json(file.read())
+                _recipes_mtime = mtime
+            # Intern the repeated strings: thousands of recipes share the
+            # same handful of types and draw outputs and ingredients from a
+            # common pool of item ids, so comparisons become pointer checks
+            # and the duplicates collapse to one object each
+            intern = sys.intern
+            for recipe in recipes.values():
+                recipe_type = recipe.get("type")
+                if type(recipe_type) is str:
+                    recipe["type"] = intern(recipe_type)
+                output = recipe.get("output")
+                if type(output) is str:
+                    recipe["output"] = intern(output)
+                ingredients = recipe.get("ingredients")
+                if type(ingredients) is list:
+                    recipe["ingredients"] = [
+                        intern(item) if type(item) is str else item
+                        for item in ingredients
+                    ]
+            logging.info("Loaded %d recipes from %s", len(recipes), RECIPES_FILE)
+        except FileNotFoundError:
+            logging.warning("Recipe file %s not found. Creating empty recipe file.", RECIPES_FILE)
             # Create an empty recipes file
             with open(RECIPES_FILE, 'w') as file:
                 json.dump({}, file, indent=4)
             recipes = {}
+            _recipes_mtime = None
     except json.JSONDecodeError:
-        logging.error(f"Error decoding JSON from {RECIPES_FILE}. Starting with empty recipe collection.")
+        logging.error("Error decoding JSON from %s. Starting with empty recipe collection.", RECIPES_FILE)
         # Backup the corrupted file and create a new empty one
         backup_file = f"{RECIPES_FILE}.backup.{int(time.time())}"
         try:
             if os.path.exists(RECIPES_FILE):
                 os.rename(RECIPES_FILE, backup_file)
-                logging.warning(f"Corrupted recipe file backed up to {backup_file}")
+                logging.warning("Corrupted recipe file backed up to %s", backup_file)
             # Create a new empty recipes file
             with open(RECIPES_FILE, 'w') as file:
                 json.dump({}, file, indent=4)
             recipes = {}
         except Exception as e:
-            logging.error(f"Error backing up corrupted recipe file: {str(e)}")
+            logging.error("Error backing up corrupted recipe file: %s", e)
             recipes = {}
     except Exception as e:
-        logging.error(f"Error loading recipes: {str(e)}")
+        logging.error("Error loading recipes: %s", e)
         recipes = {}
 
+    replayed = _replay_wal()
+    _rebuild_search_index()
+    if replayed:
+        # Fold the replayed journal into recipes.json on the next save
+        _recipes_dirty = True
+
+def _write_file_atomic(path: str, data: bytes) -> None:
+    """Write bytes to a path via a temporary file and os.replace.
+
+    The target is never left truncated or half-written: either the old
+    content survives or the new content fully replaces it.
+    """
+    tmp_file = path + '.tmp'
+    try:
+        with open(tmp_file, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_file, path)
+    except Exception:
+        try:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
 def save_recipes() -> bool:
     """Save recipes to the JSON file.
 
+    Skips the write entirely when nothing has changed, and writes via a
+    temporary file plus os.replace so a crash mid-write can never leave a
+    corrupted recipes file behind.
+
     Returns:
         bool: True if successful, False otherwise
     """
+    global _recipes_dirty, _recipes_mtime
+    if not _recipes_dirty:
+        return True
+
+    tmp_file = RECIPES_FILE + '.tmp'
     try:
-        with open(RECIPES_FILE, 'w') as file:
-            json.dump(recipes, file, indent=4)
-        logging.info(f"Saved {len(recipes)} recipes to {RECIPES_FILE}")
+        # Compact bytes on the hot path; export_recipes pretty-prints for humans
+        with open(tmp_file, 'wb') as file:
+            file.write(dumps_compact(recipes))
+        os.replace(tmp_file, RECIPES_FILE)
+        # The full file now holds everything the WAL recorded
+        _truncate_wal()
+        _recipes_dirty = False
+        _recipes_mtime = os.stat(RECIPES_FILE).st_mtime_ns
+        logging.info("Saved %d recipes to %s", len(recipes), RECIPES_FILE)
         print(f"Saved {len(recipes)} recipes to {RECIPES_FILE}")
         return True
     except Exception as e:
+        try:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        except OSError:
+            pass
         # Use messagebox in GUI mode if available, otherwise print
         if 'messagebox' in globals() and TKINTER_AVAILABLE:
             messagebox.showerror("Error", f"Error saving recipes: {str(e)}")
@@ -413,6 +915,99 @@ def save_recipes() -> bool:
             print(f"Error saving recipes: {str(e)}")
         return False
 
+# Make sure pending mutations reach disk even on unexpected exits; this is
+# a no-op when the recipes are already saved.
+atexit.register(save_recipes)
+
+# Write-ahead log for single-recipe IPC mutations. Appending one JSON line
+# per change is O(1) in the library size, where save_recipes rewrites the
+# whole file. The log is replayed over recipes.json on load and folded
+# back into it by the next full save, which truncates the log; recipes.json
+# therefore stays the canonical file documented in the README.
+_WAL_COMPACT_EVERY = 256
+_wal_file = None
+_wal_ops = 0
+
+def _wal_path() -> str:
+    return RECIPES_FILE + '.wal'
+
+def _wal_append(op: Dict[str, Any]) -> bool:
+    """Append one operation to the write-ahead log and sync it to disk.
+
+    Args:
+        op (Dict[str, Any]): An {'op': 'put'/'del', 'name': ..., ...} record
+
+    Returns:
+        bool: True if the record is durable, False if the caller should
+        fall back to a full save
+    """
+    global _wal_file, _wal_ops
+    try:
+        if _wal_file is None:
+            _wal_file = open(_wal_path(), 'ab')
+        _wal_file.write(dumps_compact(op) + b'\n')
+        _wal_file.flush()
+        os.fsync(_wal_file.fileno())
+    except Exception as e:
+        logging.error("Error appending to recipe WAL: %s", e)
+        return False
+    _wal_ops += 1
+    if _wal_ops >= _WAL_COMPACT_EVERY:
+        # Fold the log back into recipes.json before it grows unbounded
+        save_recipes()
+    return True
+
+def _truncate_wal() -> None:
+    """Discard the write-ahead log after its operations reach recipes.json."""
+    global _wal_file, _wal_ops
+    if _wal_file is not None:
+        try:
+            _wal_file.close()
+        except OSError:
+            pass
+        _wal_file = None
+    _wal_ops = 0
+    try:
+        os.remove(_wal_path())
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning("Could not remove recipe WAL: %s", e)
+
+def _replay_wal() -> int:
+    """Apply any logged operations left over from a previous process.
+
+    A torn final line (crash mid-append) ends the replay; everything
+    before it is still applied.
+
+    Returns:
+        int: The number of operations replayed
+    """
+    try:
+        with open(_wal_path(), 'rb') as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logging.error("Error reading recipe WAL: %s", e)
+        return 0
+    replayed = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            op = loads_json(line)
+            if op['op'] == 'put':
+                recipes[op['name']] = op['recipe']
+            elif op['op'] == 'del':
+                recipes.pop(op['name'], None)
+        except (ValueError, KeyError, TypeError):
+            break
+        replayed += 1
+    if replayed:
+        logging.info("Replayed %d operations from the recipe WAL", replayed)
+    return replayed
+
 def create_recipe() -> None:
     """Create a new recipe and add it to the collection."""
     try:
@@ -428,20 +1023,6 @@ def create_recipe() -> None:
         # Ask if user wants normal or modded recipe
         is_modded, addon_info = choose_recipe_type()
 
-        # Define recipe types
-        recipe_types = [
-            "shaped",
-            "shapeless",
-            "smithing",
-            "smelting",
-            "blasting",
-            "smoking",
-            "campfire_cooking",
-            "stonecutting",
-            "brewing",
-            "custom"
-        ]
-
         # If modded and addon info is available, display it
         if is_modded and addon_info:
             print(f"\nUsing addon: {addon_info['name']}")
@@ -450,21 +1031,19 @@ def create_recipe() -> None:
 
         # Display recipe types with numbers
         print("\nSelect recipe type:")
-        for i, rt in enumerate(recipe_types, 1):
-            print(f"{i}. {rt}")
+        print(_TYPE_PROMPT)
 
         # Get user selection
         selection = input("Enter number (1-10): ").strip()
-        try:
-            selection_index = int(selection) - 1
-            if 0 <= selection_index < len(recipe_types):
-                recipe_type = recipe_types[selection_index]
-            else:
-                print("Invalid selection. Please enter a number between 1 and 10.")
-                return
-        except ValueError:
+        if not selection.isdigit():
             print("Invalid input. Please enter a number.")
             return
+        selection_index = int(selection) - 1
+        if 0 <= selection_index < len(RECIPE_TYPES):
+            recipe_type = RECIPE_TYPES[selection_index]
+        else:
+            print("Invalid selection. Please enter a number between 1 and 10.")
+            return
 
         output = input("Enter the output item: ").strip()
         if not output:
@@ -476,7 +1055,7 @@ def create_recipe() -> None:
             print("Ingredients cannot be empty.")
             return
 
-        ingredients = [item.strip() for item in ingredients_input.split(',') if item.strip()]
+        ingredients = parse_ingredients(ingredients_input)
 
         if not ingredients:
             print("At least one valid ingredient is required.")
@@ -494,6 +1073,7 @@ def create_recipe() -> None:
             recipe["addon_url"] = addon_info["url"]
 
         recipes[recipe_name] = recipe
+        _index_recipe(recipe_name, recipe)
         if save_recipes():
             print("Recipe created successfully.")
             # Allow direct editing after creation
@@ -517,62 +1097,61 @@ def edit_recipe(recipe_name: Optional[str] = None) -> None:
             return
 
         print("Current recipe:")
-        print(json.dumps(recipes[recipe_name], indent=4))
-
-        # Define recipe types
-        recipe_types = [
-            "shaped",
-            "shapeless",
-            "smithing",
-            "smelting",
-            "blasting",
-            "smoking",
-            "campfire_cooking",
-            "stonecutting",
-            "brewing",
-            "custom"
-        ]
+        print(_pretty_recipe(recipe_name))
 
         # Display recipe types with numbers
         print("Select recipe type (or press Enter to keep the current type):")
         print("0. Keep current type")
-        for i, rt in enumerate(recipe_types, 1):
-            print(f"{i}. {rt}")
+        print(_TYPE_PROMPT)
 
         # Get user selection
         selection = input("Enter number (0-10): ").strip()
         if selection:
-            try:
+            if not selection.isdigit():
+                print("Invalid input. Using current type.")
+                recipe_type = ""
+            else:
                 selection_index = int(selection)
                 if selection_index == 0:
                     recipe_type = ""  # Keep current type
-                elif 1 <= selection_index <= len(recipe_types):
-                    recipe_type = recipe_types[selection_index - 1]
+                elif 1 <= selection_index <= len(RECIPE_TYPES):
+                    recipe_type = RECIPE_TYPES[selection_index - 1]
                 else:
                     print("Invalid selection. Using current type.")
                     recipe_type = ""
-            except ValueError:
-                print("Invalid input. Using current type.")
-                recipe_type = ""
         else:
             recipe_type = ""  # Keep current type if Enter is pressed
 
         output = input("Enter the new output item (or press Enter to keep the current output): ").strip()
         ingredients_input = input("Enter the new ingredients (comma-separated, or press Enter to keep the current ingredients): ").strip()
 
-        if recipe_type:
+        # Only touch fields that actually changed; pressing Enter through
+        # every prompt (the "open to check" workflow) should not dirty or
+        # rewrite the file.
+        changed = False
+
+        if recipe_type and recipe_type != recipes[recipe_name]["type"]:
             recipes[recipe_name]["type"] = recipe_type
+            changed = True
 
-        if output:
+        if output and output != recipes[recipe_name]["output"]:
             recipes[recipe_name]["output"] = output
+            changed = True
 
         if ingredients_input:
-            ingredients = [item.strip() for item in ingredients_input.split(',') if item.strip()]
+            ingredients = parse_ingredients(ingredients_input)
             if ingredients:  # Only update if there's at least one valid ingredient
-                recipes[recipe_name]["ingredients"] = ingredients
+                if ingredients != recipes[recipe_name]["ingredients"]:
+                    recipes[recipe_name]["ingredients"] = ingredients
+                    changed = True
             else:
                 print("Warning: No valid ingredients provided. Keeping existing ingredients.")
 
+        if not changed:
+            print("No changes made; recipe left as-is.")
+            return
+
+        _index_recipe(recipe_name, recipes[recipe_name])
         if save_recipes():
             print("Recipe edited successfully.")
 
@@ -597,6 +1176,7 @@ def delete_recipe() -> None:
             return
 
         del recipes[recipe_name]
+        _unindex_recipe(recipe_name)
         if save_recipes():
             print("Recipe deleted successfully.")
 
@@ -610,10 +1190,16 @@ def view_recipes() -> None:
             print("No recipes found.")
             return
 
-        for recipe_name, recipe in recipes.items():
-            print(f"Recipe filename: {recipe_name}")
-            print(json.dumps(recipe, indent=4))
-            print("-" * 30)
+        # Build the whole listing and write it in one go instead of three
+        # print calls (and flushes) per recipe
+        pretty = _pretty_recipe
+        separator = "\n" + "-" * 30 + "\n"
+        buf = []
+        for recipe_name in recipes:
+            buf.append(f"Recipe filename: {recipe_name}\n")
+            buf.append(pretty(recipe_name))
+            buf.append(separator)
+        sys.stdout.write(''.join(buf))
 
     except Exception as e:
         print(f"An error occurred: {str(e)}")
@@ -630,26 +1216,20 @@ def search_recipe() -> None:
             print("Search term cannot be empty.")
             return
 
-        found = False
-
-        for recipe_name, recipe in recipes.items():
-            # Search in recipe filename
-            if search_term in recipe_name.lower():
-                found = True
-                print(f"Recipe filename: {recipe_name}")
-                print(json.dumps(recipe, indent=4))
-                print("-" * 30)
-                continue
-
-            # Search in recipe content
-            recipe_str = json.dumps(recipe).lower()
-            if search_term in recipe_str:
-                found = True
-                print(f"Recipe filename: {recipe_name}")
-                print(json.dumps(recipe, indent=4))
-                print("-" * 30)
-
-        if not found:
+        # The blobs contain the lowercased filename and recipe content, so a
+        # single substring check covers both without re-serializing anything;
+        # large collections are scanned as one joined corpus.
+        pretty = _pretty_recipe
+        separator = "\n" + "-" * 30 + "\n"
+        buf = []
+        for recipe_name in _matching_recipe_names(search_term):
+            buf.append(f"Recipe filename: {recipe_name}\n")
+            buf.append(pretty(recipe_name))
+            buf.append(separator)
+
+        if buf:
+            sys.stdout.write(''.join(buf))
+        else:
             print(f"No recipes found matching '{search_term}'.")
 
     except Exception as e:
@@ -667,10 +1247,9 @@ def export_recipes() -> None:
         if not filename.endswith('.js') and not filename.endswith('.json'):
             filename += '.js'
 
-        with open(filename, 'w') as file:
-            json.dump(recipes, file, indent=4)
+        _write_file_atomic(filename, dumps_pretty(recipes))
 
-        logging.info(f"Recipes exported successfully to {filename}")
+        logging.info("Recipes exported successfully to %s", filename)
         print(f"Recipes exported successfully to {filename}.")
 
     except Exception as e:
@@ -714,12 +1293,24 @@ def run_cli() -> None:
             print("Invalid choice. Please enter a number between 1 and 7.")
 
 # GUI-related code
-try:
-    import tkinter as tk
-    from tkinter import ttk, messagebox, scrolledtext, filedialog
-    TKINTER_AVAILABLE = True
-except ImportError:
-    TKINTER_AVAILABLE = False
+# Tkinter is only needed in GUI mode. CLI and IPC runs pay for a module spec
+# lookup here instead of importing the whole widget toolkit at startup; the
+# real import happens lazily the first time the GUI is launched.
+import importlib.util
+
+TKINTER_AVAILABLE = importlib.util.find_spec('tkinter') is not None
+
+def _load_tkinter() -> None:
+    """Import the tkinter modules into module globals on first GUI use."""
+    global tk, ttk, messagebox, scrolledtext, filedialog, TKINTER_AVAILABLE
+    if 'tk' in globals():
+        return
+    try:
+        import tkinter as tk
+        from tkinter import ttk, messagebox, scrolledtext, filedialog
+    except ImportError:
+        # find_spec can succeed while the _tkinter extension is missing
+        TKINTER_AVAILABLE = False
 
 class RecipeManagerApp:
     def __init__(self, root):
@@ -755,6 +1346,50 @@ class RecipeManagerApp:
         load_recipes()
         self.update_recipe_list()
 
+        # Background writer for recipe saves: a single-slot queue holding
+        # the latest serialized snapshot, so rapid edits coalesce and the
+        # Tk loop never blocks on disk I/O
+        self._save_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._save_worker, daemon=True).start()
+
+    def _enqueue_save(self):
+        """Snapshot the recipes and hand the bytes to the writer thread.
+
+        Serialization happens here on the Tk thread, so the snapshot is
+        consistent; only the write leaves the main loop. If a previous
+        snapshot is still queued it is replaced — the newest one wins.
+        """
+        blob = dumps_compact(recipes)
+        while True:
+            try:
+                self._save_queue.put_nowait(blob)
+                return
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _save_worker(self):
+        """Write queued recipe snapshots to disk atomically."""
+        global _recipes_mtime
+        while True:
+            blob = self._save_queue.get()
+            tmp_file = RECIPES_FILE + '.tmp'
+            try:
+                with open(tmp_file, 'wb') as file:
+                    file.write(blob)
+                os.replace(tmp_file, RECIPES_FILE)
+                _recipes_mtime = os.stat(RECIPES_FILE).st_mtime_ns
+            except Exception as e:
+                try:
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+                except OSError:
+                    pass
+                self.root.after(0, messagebox.showerror, "Error",
+                                f"Error saving recipes: {str(e)}")
+
     def create_menu(self):
         menubar = tk.Menu(self.root)
 
@@ -852,24 +1487,13 @@ class RecipeManagerApp:
 
         # Store addon data
         self.addons_data = []
+        self._addons_by_name = {}
 
-        # Recipe Type
-        ttk.Label(form_frame, text="Recipe Type:").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.add_type_var = tk.StringVar()
-        type_combo = ttk.Combobox(form_frame, textvariable=self.add_type_var, width=38)
-        type_combo['values'] = ('shaped', 'shapeless', 'smithing', 'smelting', 'blasting', 'smoking', 'campfire_cooking', 'stonecutting', 'brewing', 'custom')
-        type_combo.grid(row=4, column=1, sticky=tk.W, pady=5)
+        # Pending after() ids for debounced callbacks, keyed by callback name
+        self._debounce_ids = {}
 
-        # Output
-        ttk.Label(form_frame, text="Output Item:").grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.add_output_var = tk.StringVar()
-        ttk.Entry(form_frame, textvariable=self.add_output_var, width=40).grid(row=5, column=1, sticky=tk.W, pady=5)
-
-        # Ingredients
-        ttk.Label(form_frame, text="Ingredients:").grid(row=6, column=0, sticky=tk.W, pady=5)
-        ttk.Label(form_frame, text="(comma-separated)").grid(row=7, column=0, sticky=tk.W)
-        self.add_ingredients_text = scrolledtext.ScrolledText(form_frame, width=40, height=10, wrap=tk.WORD)
-        self.add_ingredients_text.grid(row=6, column=1, rowspan=2, sticky=tk.W, pady=5)
+        # Recipe Type / Output / Ingredients (shared with the edit tab)
+        self._build_recipe_form(form_frame, 'add', first_row=4)
 
         # Buttons
         button_frame = ttk.Frame(form_frame)
@@ -891,6 +1515,11 @@ class RecipeManagerApp:
         self.edit_recipe_combo = ttk.Combobox(selection_frame, textvariable=self.edit_recipe_var, width=40)
         self.edit_recipe_combo.pack(side=tk.LEFT, padx=5)
         self.edit_recipe_combo.bind('<<ComboboxSelected>>', self.on_edit_recipe_select)
+        # Narrow the dropdown as the user types so huge collections don't
+        # push every name across the Tcl bridge on each refresh
+        self.edit_recipe_combo.bind(
+            '<KeyRelease>',
+            lambda e: self._debounce(self.filter_edit_recipe_combo))
 
         ttk.Button(selection_frame, text="Load Recipe", command=self.load_recipe_for_edit).pack(side=tk.LEFT, padx=5)
 
@@ -898,23 +1527,8 @@ class RecipeManagerApp:
         form_frame = ttk.Frame(edit_tab, padding="10")
         form_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Recipe Type
-        ttk.Label(form_frame, text="Recipe Type:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.edit_type_var = tk.StringVar()
-        type_combo = ttk.Combobox(form_frame, textvariable=self.edit_type_var, width=38)
-        type_combo['values'] = ('shaped', 'shapeless', 'smithing', 'smelting', 'blasting', 'smoking', 'campfire_cooking', 'stonecutting', 'brewing', 'custom')
-        type_combo.grid(row=0, column=1, sticky=tk.W, pady=5)
-
-        # Output
-        ttk.Label(form_frame, text="Output Item:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.edit_output_var = tk.StringVar()
-        ttk.Entry(form_frame, textvariable=self.edit_output_var, width=40).grid(row=1, column=1, sticky=tk.W, pady=5)
-
-        # Ingredients
-        ttk.Label(form_frame, text="Ingredients:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        ttk.Label(form_frame, text="(comma-separated)").grid(row=3, column=0, sticky=tk.W)
-        self.edit_ingredients_text = scrolledtext.ScrolledText(form_frame, width=40, height=10, wrap=tk.WORD)
-        self.edit_ingredients_text.grid(row=2, column=1, rowspan=2, sticky=tk.W, pady=5)
+        # Recipe Type / Output / Ingredients (shared with the add tab)
+        self._build_recipe_form(form_frame, 'edit', first_row=0)
 
         # Buttons
         button_frame = ttk.Frame(form_frame)
@@ -923,6 +1537,36 @@ class RecipeManagerApp:
         ttk.Button(button_frame, text="Reset Changes", command=self.reset_edit_form).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Save Changes", command=self.save_edited_recipe).pack(side=tk.LEFT)
 
+    def _build_recipe_form(self, form_frame, prefix, first_row):
+        """Build the type/output/ingredients rows shared by the recipe forms.
+
+        Creates self.<prefix>_type_var, self.<prefix>_output_var and
+        self.<prefix>_ingredients_text; the add and edit tabs used to
+        duplicate this widget sequence line for line.
+        """
+        row = first_row
+
+        # Recipe Type
+        ttk.Label(form_frame, text="Recipe Type:").grid(row=row, column=0, sticky=tk.W, pady=5)
+        type_var = tk.StringVar()
+        setattr(self, prefix + '_type_var', type_var)
+        type_combo = ttk.Combobox(form_frame, textvariable=type_var, width=38)
+        type_combo['values'] = RECIPE_TYPES
+        type_combo.grid(row=row, column=1, sticky=tk.W, pady=5)
+
+        # Output
+        ttk.Label(form_frame, text="Output Item:").grid(row=row + 1, column=0, sticky=tk.W, pady=5)
+        output_var = tk.StringVar()
+        setattr(self, prefix + '_output_var', output_var)
+        ttk.Entry(form_frame, textvariable=output_var, width=40).grid(row=row + 1, column=1, sticky=tk.W, pady=5)
+
+        # Ingredients
+        ttk.Label(form_frame, text="Ingredients:").grid(row=row + 2, column=0, sticky=tk.W, pady=5)
+        ttk.Label(form_frame, text="(comma-separated)").grid(row=row + 3, column=0, sticky=tk.W)
+        ingredients_text = scrolledtext.ScrolledText(form_frame, width=40, height=10, wrap=tk.WORD)
+        setattr(self, prefix + '_ingredients_text', ingredients_text)
+        ingredients_text.grid(row=row + 2, column=1, rowspan=2, sticky=tk.W, pady=5)
+
     def create_search_tab(self):
         search_tab = ttk.Frame(self.notebook)
         self.notebook.add(search_tab, text="Search Recipes")
@@ -933,7 +1577,10 @@ class RecipeManagerApp:
 
         ttk.Label(search_frame, text="Search Term:").pack(side=tk.LEFT, padx=5)
         self.search_var = tk.StringVar()
-        ttk.Entry(search_frame, textvariable=self.search_var, width=40).pack(side=tk.LEFT, padx=5)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        # Live search while typing; the debounce keeps one scan per pause
+        search_entry.bind('<KeyRelease>', self.on_search_key)
         ttk.Button(search_frame, text="Search", command=self.search_recipes).pack(side=tk.LEFT, padx=5)
 
         # Results frame
@@ -946,18 +1593,42 @@ class RecipeManagerApp:
         self.search_results.pack(fill=tk.BOTH, expand=True)
         self.search_results.config(state=tk.DISABLED)
 
+    def insert_recipe_row(self, recipe_name):
+        """Insert one name into the view list without rebuilding it.
+
+        The module-level sorted list already contains the name (the index
+        hooks maintain it), so its position gives the listbox row.
+        """
+        index = bisect.bisect_left(_recipe_names_sorted, recipe_name)
+        self.recipe_listbox.insert(index, recipe_name)
+        self.edit_recipe_combo['values'] = _recipe_names_sorted
+        self.status_var.set(f"Loaded {len(recipes)} recipes")
+
+    def remove_recipe_row(self, index):
+        """Remove one row from the view list without rebuilding it."""
+        self.recipe_listbox.delete(index)
+        self.edit_recipe_combo['values'] = _recipe_names_sorted
+        self.status_var.set(f"Loaded {len(recipes)} recipes")
+
+    def filter_edit_recipe_combo(self, event=None):
+        """Filter the edit combobox values to names matching the typed prefix."""
+        self.edit_recipe_combo['values'] = _names_with_prefix(
+            self.edit_recipe_var.get().strip())
+
     def update_recipe_list(self):
         """Update the recipe list in the view tab."""
         self.recipe_listbox.delete(0, tk.END)
-        self.edit_recipe_combo['values'] = []
 
         if not recipes:
+            self.edit_recipe_combo['values'] = []
             self.status_var.set("No recipes found")
             return
 
-        recipe_names = sorted(recipes.keys())
-        for recipe_name in recipe_names:
-            self.recipe_listbox.insert(tk.END, recipe_name)
+        # Already maintained in sorted order by the mutation sites; one
+        # starred insert hands the whole list to Tcl in a single call
+        # instead of one round-trip per row
+        recipe_names = _recipe_names_sorted
+        self.recipe_listbox.insert(tk.END, *recipe_names)
 
         self.edit_recipe_combo['values'] = recipe_names
         self.status_var.set(f"Loaded {len(recipes)} recipes")
@@ -978,94 +1649,85 @@ class RecipeManagerApp:
 
         recipe = recipes[recipe_name]
 
-        self.recipe_details.config(state=tk.NORMAL)
-        self.recipe_details.delete(1.0, tk.END)
-
-        self.recipe_details.insert(tk.END, f"Recipe filename: {recipe_name}\n\n")
-        self.recipe_details.insert(tk.END, f"Type: {recipe['type']}\n\n")
-        self.recipe_details.insert(tk.END, f"Output: {recipe['output']}\n\n")
-        self.recipe_details.insert(tk.END, "Ingredients:\n")
-
-        for ingredient in recipe['ingredients']:
-            self.recipe_details.insert(tk.END, f"- {ingredient}\n")
+        # One insert instead of one Tcl round-trip per field and ingredient
+        details = (
+            f"Recipe filename: {recipe_name}\n\n"
+            f"Type: {recipe['type']}\n\n"
+            f"Output: {recipe['output']}\n\n"
+            "Ingredients:\n"
+            + ''.join(f"- {ingredient}\n" for ingredient in recipe['ingredients'])
+        )
+        self._set_readonly_text(self.recipe_details, details)
 
-        self.recipe_details.config(state=tk.DISABLED)
+    def _validate_new_recipe(self):
+        """Read and validate the Add-tab form in one pass.
 
-    def add_recipe(self):
-        """Add a new recipe."""
+        Returns:
+            Tuple[Optional[str], str, Optional[Dict[str, Any]]]: The recipe
+            name, an error message (empty on success), and the built recipe
+            dict. Each field is read from its widget exactly once.
+        """
         recipe_name = self.add_name_var.get().strip()
         recipe_type = self.add_type_var.get().strip()
         output = self.add_output_var.get().strip()
         ingredients_input = self.add_ingredients_text.get(1.0, tk.END).strip()
         is_modded = self.add_mode_var.get() == "Modded"
 
-        # Validate inputs
         if not recipe_name:
-            messagebox.showerror("Error", "Recipe filename cannot be empty.")
-            return
-
+            return None, "Recipe filename cannot be empty.", None
         if recipe_name in recipes:
-            messagebox.showerror("Error", "A recipe with this filename already exists.")
-            return
-
+            return None, "A recipe with this filename already exists.", None
         if not recipe_type:
-            messagebox.showerror("Error", "Recipe type cannot be empty.")
-            return
-
+            return None, "Recipe type cannot be empty.", None
         if not output:
-            messagebox.showerror("Error", "Output item cannot be empty.")
-            return
-
+            return None, "Output item cannot be empty.", None
         if not ingredients_input:
-            messagebox.showerror("Error", "Ingredients cannot be empty.")
-            return
-
-        ingredients = [item.strip() for item in ingredients_input.split(',') if item.strip()]
+            return None, "Ingredients cannot be empty.", None
 
+        ingredients = parse_ingredients(ingredients_input)
         if not ingredients:
-            messagebox.showerror("Error", "At least one valid ingredient is required.")
-            return
+            return None, "At least one valid ingredient is required.", None
 
         # Check if modded and addon is selected
         addon_info = None
         if is_modded:
             selected_addon = self.addon_var.get()
             if not selected_addon:
-                messagebox.showerror("Error", "Please select an addon or switch to Normal recipe mode.")
-                return
-
-            # Find the selected addon in the data
-            for addon in self.addons_data:
-                if addon['name'] == selected_addon:
-                    addon_info = addon
-                    break
-
+                return None, "Please select an addon or switch to Normal recipe mode.", None
+            addon_info = self._addons_by_name.get(selected_addon)
             if not addon_info:
-                messagebox.showerror("Error", "Selected addon information not found.")
-                return
+                return None, "Selected addon information not found.", None
 
-        # Create recipe
         recipe = {
             "type": recipe_type,
             "output": output,
             "ingredients": ingredients
         }
-
-        # Add addon info if modded
-        if is_modded and addon_info:
+        if addon_info:
             recipe["addon"] = addon_info["name"]
             recipe["addon_url"] = addon_info["url"]
+        return recipe_name, "", recipe
+
+    def add_recipe(self):
+        """Add a new recipe."""
+        recipe_name, error, recipe = self._validate_new_recipe()
+        if error:
+            messagebox.showerror("Error", error)
+            return
 
         recipes[recipe_name] = recipe
-        if save_recipes():
-            messagebox.showinfo("Success", "Recipe created successfully.")
-            self.clear_add_form()
-            # Set the edit_recipe_var before updating the recipe list
-            self.edit_recipe_var.set(recipe_name)
-            self.update_recipe_list()
-            # Allow direct editing after creation
-            self.load_recipe_for_edit()
-            self.notebook.select(2)  # Switch to Edit tab
+        _index_recipe(recipe_name, recipe)
+        self._enqueue_save()
+        messagebox.showinfo("Success", "Recipe created successfully.")
+        self.clear_add_form()
+        # Set the edit_recipe_var before updating the recipe list
+        self.edit_recipe_var.set(recipe_name)
+        # One row changed, so insert just that row instead of
+        # rebuilding the whole list
+        self.insert_recipe_row(recipe_name)
+        # Allow direct editing after creation
+        self.load_recipe_for_edit()
+        self.notebook.select(2)  # Switch to Edit tab
 
     def toggle_addon_selection(self):
         """Show or hide addon selection based on recipe mode."""
@@ -1079,95 +1741,137 @@ class RecipeManagerApp:
             self.addon_info_frame.grid_remove()
 
     def force_update_addons_database(self):
-        """Force update the addons database from the web."""
-        try:
-            self.status_var.set("Forcing update of addons database...")
-            self.root.update_idletasks()  # Update the UI to show status
+        """Force update the addons database from the web.
+
+        The network fetch, parse and database write run on a background
+        thread so the HTTP round-trip no longer freezes the Tk main loop;
+        the widget updates are marshalled back via root.after.
+        """
+        if getattr(self, '_addons_update_running', False):
+            return  # A fetch is already in flight
+        self._addons_update_running = True
+        self.status_var.set("Forcing update of addons database...")
+
+        def worker():
+            web_addons, error = [], None
+            try:
+                # Delete the existing database file if it exists
+                if os.path.exists(ADDONS_DB_FILE):
+                    os.remove(ADDONS_DB_FILE)
+                    print("Deleted existing addons database file.")
+                _invalidate_addons_memo()
 
-            # Delete the existing database file if it exists
-            if os.path.exists(ADDONS_DB_FILE):
-                os.remove(ADDONS_DB_FILE)
-                print("Deleted existing addons database file.")
+                # Fetch addons from the web over the shared connection
+                status, response_headers, html_content = http_get(KUBEJS_ADDONS_URL)
 
-            # Fetch addons from the web using urllib.request
-            with urllib.request.urlopen(KUBEJS_ADDONS_URL) as response:
                 # Check if the response is successful (200 OK)
-                if response.status != 200:
-                    raise Exception(f"HTTP Error: {response.status}")
+                if status != 200:
+                    raise Exception(f"HTTP Error: {status}")
+
+                # Extract addon links from the raw response in one pass
+                web_addons = extract_addons(html_content)
+
+                # Save the addons to the database
+                if web_addons and not save_addons_to_db(
+                        web_addons,
+                        etag=response_headers.get('ETag'),
+                        last_modified=response_headers.get('Last-Modified')):
+                    error = "Failed to save addons to database."
+            except Exception as e:
+                error = f"Error updating addons database: {str(e)}"
+            self.root.after(0, self.on_addons_database_updated, web_addons, error)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_addons_database_updated(self, web_addons, error):
+        """Apply the result of a background addons update on the Tk thread."""
+        self._addons_update_running = False
+
+        if error:
+            messagebox.showerror("Error", error)
+            self.status_var.set("Error updating database")
+            return
 
-                # Read and decode the response
-                html_content = response.read().decode('utf-8')
+        if not web_addons:
+            messagebox.showinfo("No Addons Found", "No addons found on the web.")
+            self.status_var.set("No addons found")
+            return
 
-                # Use our custom parser instead of BeautifulSoup
-                parser = KubeJSAddonParser()
-                parser.feed(html_content)
-                web_addons = parser.addons
+        messagebox.showinfo("Success", f"Successfully updated addons database with {len(web_addons)} addons.")
 
-            if not web_addons:
-                messagebox.showinfo("No Addons Found", "No addons found on the web.")
-                self.status_var.set("No addons found")
-                return
+        # Update the GUI with the new addons
+        self.addons_data = web_addons
+        self._addons_by_name = {addon['name']: addon for addon in web_addons}
 
-            # Save the addons to the database
-            if save_addons_to_db(web_addons):
-                messagebox.showinfo("Success", f"Successfully updated addons database with {len(web_addons)} addons.")
+        # Update the combo box with addon names
+        addon_names = [addon['name'] for addon in self.addons_data]
+        self.addon_combo['values'] = addon_names
 
-                # Update the GUI with the new addons
-                self.addons_data = web_addons
+        # Select the first addon
+        if addon_names:
+            self.addon_combo.current(0)
+            self.update_addon_info()
 
-                # Update the combo box with addon names
-                addon_names = [addon['name'] for addon in self.addons_data]
-                self.addon_combo['values'] = addon_names
+        # Show the addon info frame
+        self.addon_info_frame.grid()
 
-                # Select the first addon
-                if addon_names:
-                    self.addon_combo.current(0)
-                    self.update_addon_info()
+        self.status_var.set(f"Updated database with {len(web_addons)} addons")
 
-                # Show the addon info frame
-                self.addon_info_frame.grid()
+    def fetch_addons_for_gui(self):
+        """Fetch KubeJS addons for the GUI.
+
+        The fetch (which may hit the network on a cache miss) runs on a
+        background thread so the Tk main loop keeps painting; the widget
+        updates are marshalled back via root.after.
+        """
+        if getattr(self, '_addons_fetch_running', False):
+            return  # A fetch is already in flight
+        self._addons_fetch_running = True
+        self.status_var.set("Fetching KubeJS addons...")
+
+        def worker():
+            addons, error = [], None
+            try:
+                addons = fetch_kubejs_addons()
+            except Exception as e:
+                error = f"Error fetching addons: {str(e)}"
+            self.root.after(0, self.on_addons_fetched, addons, error)
 
-                self.status_var.set(f"Updated database with {len(web_addons)} addons")
-            else:
-                messagebox.showerror("Error", "Failed to save addons to database.")
-                self.status_var.set("Failed to update database")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error updating addons database: {str(e)}")
-            self.status_var.set("Error updating database")
+        threading.Thread(target=worker, daemon=True).start()
 
-    def fetch_addons_for_gui(self):
-        """Fetch KubeJS addons for the GUI."""
-        try:
-            self.status_var.set("Fetching KubeJS addons...")
-            self.root.update_idletasks()  # Update the UI to show status
+    def on_addons_fetched(self, addons, error):
+        """Apply the result of a background addon fetch on the Tk thread."""
+        self._addons_fetch_running = False
 
-            # Fetch addons
-            self.addons_data = fetch_kubejs_addons()
+        if error:
+            messagebox.showerror("Error", error)
+            self.status_var.set("Error fetching addons")
+            return
 
-            if not self.addons_data:
-                messagebox.showinfo("No Addons Found", "No addons found or error fetching addons.")
-                self.status_var.set("No addons found")
-                return
+        self.addons_data = addons
+        self._addons_by_name = {addon['name']: addon for addon in addons}
 
-            # Update the combo box with addon names
-            addon_names = [addon['name'] for addon in self.addons_data]
-            self.addon_combo['values'] = addon_names
+        if not self.addons_data:
+            messagebox.showinfo("No Addons Found", "No addons found or error fetching addons.")
+            self.status_var.set("No addons found")
+            return
 
-            # Select the first addon
-            if addon_names:
-                self.addon_combo.current(0)
-                self.update_addon_info()
+        # Update the combo box with addon names
+        addon_names = [addon['name'] for addon in self.addons_data]
+        self.addon_combo['values'] = addon_names
 
-            # Show the addon info frame
-            self.addon_info_frame.grid()
+        # Select the first addon
+        if addon_names:
+            self.addon_combo.current(0)
+            self.update_addon_info()
 
-            # Bind the combobox selection event
-            self.addon_combo.bind('<<ComboboxSelected>>', lambda e: self.update_addon_info())
+        # Show the addon info frame
+        self.addon_info_frame.grid()
 
-            self.status_var.set(f"Fetched {len(self.addons_data)} KubeJS addons")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error fetching addons: {str(e)}")
-            self.status_var.set("Error fetching addons")
+        # Bind the combobox selection event
+        self.addon_combo.bind('<<ComboboxSelected>>', lambda e: self.update_addon_info())
+
+        self.status_var.set(f"Fetched {len(self.addons_data)} KubeJS addons")
 
     def update_addon_info(self):
         """Update the addon information text."""
@@ -1175,23 +1879,18 @@ class RecipeManagerApp:
         if not selected_addon:
             return
 
-        # Find the selected addon in the data
-        addon_info = None
-        for addon in self.addons_data:
-            if addon['name'] == selected_addon:
-                addon_info = addon
-                break
-
+        # O(1) lookup; this fires on every combobox selection event
+        addon_info = self._addons_by_name.get(selected_addon)
         if not addon_info:
             return
 
         # Update the addon info text
-        self.addon_info_text.config(state=tk.NORMAL)
-        self.addon_info_text.delete(1.0, tk.END)
-        self.addon_info_text.insert(tk.END, f"Name: {addon_info['name']}\n")
-        self.addon_info_text.insert(tk.END, f"URL: {addon_info['url']}\n")
-        self.addon_info_text.insert(tk.END, "Note: You may need to refer to the addon documentation for specific recipe types and formats.")
-        self.addon_info_text.config(state=tk.DISABLED)
+        self._set_readonly_text(
+            self.addon_info_text,
+            f"Name: {addon_info['name']}\n"
+            f"URL: {addon_info['url']}\n"
+            "Note: You may need to refer to the addon documentation for specific recipe types and formats."
+        )
 
     def clear_add_form(self):
         """Clear the add recipe form."""
@@ -1202,9 +1901,34 @@ class RecipeManagerApp:
         self.add_ingredients_text.delete(1.0, tk.END)
         self.toggle_addon_selection()  # Hide addon selection
 
+    def _debounce(self, callback, delay=120):
+        """Run a callback after a quiet period, coalescing rapid events.
+
+        Repeated triggers within the delay window cancel the pending call,
+        so only the trailing event does any work.
+        """
+        pending = self._debounce_ids.get(callback.__name__)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._debounce_ids[callback.__name__] = self.root.after(delay, callback)
+
+    def _set_readonly_text(self, widget, text):
+        """Replace the contents of a read-only Text widget.
+
+        Wraps the enable/clear/insert/disable dance every display widget
+        needs; the text is inserted with a single Tcl call.
+        """
+        widget.config(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        if text:
+            widget.insert(tk.END, text)
+        widget.config(state=tk.DISABLED)
+
     def on_edit_recipe_select(self, event):
         """Handle recipe selection in the edit tab."""
-        self.load_recipe_for_edit()
+        # Debounced so arrow-keying through the dropdown doesn't rebuild
+        # the edit form for every intermediate selection
+        self._debounce(self.load_recipe_for_edit)
 
     def load_recipe_for_edit(self):
         """Load a recipe for editing."""
@@ -1219,7 +1943,7 @@ class RecipeManagerApp:
         self.edit_output_var.set(recipe['output'])
 
         self.edit_ingredients_text.delete(1.0, tk.END)
-        self.edit_ingredients_text.insert(tk.END, ", ".join(recipe['ingredients']))
+        self.edit_ingredients_text.insert(tk.END, _ingredients_joined(recipe_name))
 
     def reset_edit_form(self):
         """Reset the edit form to the original recipe values."""
@@ -1249,20 +1973,30 @@ class RecipeManagerApp:
             messagebox.showerror("Error", "Ingredients cannot be empty.")
             return
 
-        ingredients = [item.strip() for item in ingredients_input.split(',') if item.strip()]
+        ingredients = parse_ingredients(ingredients_input)
 
         if not ingredients:
             messagebox.showerror("Error", "At least one valid ingredient is required.")
             return
 
+        # Saving an untouched form is a no-op: skip the reindex and the
+        # disk write instead of rewriting identical content
+        current = recipes[recipe_name]
+        if (recipe_type == current['type'] and output == current['output']
+                and ingredients == current['ingredients']):
+            messagebox.showinfo("No Changes", "Recipe is unchanged; nothing to save.")
+            return
+
         # Update recipe
-        recipes[recipe_name]['type'] = recipe_type
-        recipes[recipe_name]['output'] = output
-        recipes[recipe_name]['ingredients'] = ingredients
+        current['type'] = recipe_type
+        current['output'] = output
+        current['ingredients'] = ingredients
+        _index_recipe(recipe_name, current)
 
-        if save_recipes():
-            messagebox.showinfo("Success", "Recipe updated successfully.")
-            self.update_recipe_list()
+        self._enqueue_save()
+        messagebox.showinfo("Success", "Recipe updated successfully.")
+        # The name didn't change, so the list and combobox contents are
+        # already correct; no rebuild needed
 
     def edit_selected_recipe(self):
         """Edit the selected recipe from the view tab."""
@@ -1290,12 +2024,26 @@ class RecipeManagerApp:
             return
 
         del recipes[recipe_name]
-        if save_recipes():
-            messagebox.showinfo("Success", "Recipe deleted successfully.")
-            self.update_recipe_list()
-            self.recipe_details.config(state=tk.NORMAL)
-            self.recipe_details.delete(1.0, tk.END)
-            self.recipe_details.config(state=tk.DISABLED)
+        _unindex_recipe(recipe_name)
+        self._enqueue_save()
+        messagebox.showinfo("Success", "Recipe deleted successfully.")
+        self.remove_recipe_row(selection[0])
+        self._set_readonly_text(self.recipe_details, '')
+
+    def on_search_key(self, event):
+        """Debounced live search: rapid typing collapses to one scan."""
+        self._debounce(self.live_search, 150)
+
+    def live_search(self):
+        """Run the search for the current entry text while typing.
+
+        Unlike the button handler, an emptied entry just clears the
+        results instead of popping an error dialog mid-keystroke.
+        """
+        if self.search_var.get().strip():
+            self.search_recipes()
+        else:
+            self._set_readonly_text(self.search_results, '')
 
     def search_recipes(self):
         """Search for recipes."""
@@ -1305,32 +2053,29 @@ class RecipeManagerApp:
             messagebox.showerror("Error", "Search term cannot be empty.")
             return
 
-        self.search_results.config(state=tk.NORMAL)
-        self.search_results.delete(1.0, tk.END)
-
-        found = False
-
-        for recipe_name, recipe in recipes.items():
-            # Search in recipe filename
-            if search_term in recipe_name.lower():
-                found = True
-                self.search_results.insert(tk.END, f"Recipe filename: {recipe_name}\n")
-                self.search_results.insert(tk.END, json.dumps(recipe, indent=4) + "\n")
-                self.search_results.insert(tk.END, "-" * 30 + "\n")
-                continue
-
-            # Search in recipe content
-            recipe_str = json.dumps(recipe).lower()
-            if search_term in recipe_str:
-                found = True
-                self.search_results.insert(tk.END, f"Recipe filename: {recipe_name}\n")
-                self.search_results.insert(tk.END, json.dumps(recipe, indent=4) + "\n")
-                self.search_results.insert(tk.END, "-" * 30 + "\n")
-
-        if not found:
-            self.search_results.insert(tk.END, f"No recipes found matching '{search_term}'.")
-
-        self.search_results.config(state=tk.DISABLED)
+        # The shared blob index covers filename and content in one check, so
+        # nothing is re-serialized per keystroke. Filename hits are ranked
+        # above content-only hits, and close name matches are appended for
+        # typo tolerance. Results are accumulated and inserted with a single
+        # Tcl call: per-hit inserts make the Text widget reflow once per line.
+        matches = _matching_recipe_names(search_term)
+        lowered = [(n, n.lower()) for n in matches]
+        name_hits = [n for n, low in lowered if search_term in low]
+        content_hits = [n for n, low in lowered if search_term not in low]
+        fuzzy_hits = [n for n in difflib.get_close_matches(
+                          search_term, _recipe_names_sorted, n=10, cutoff=0.6)
+                      if n not in name_hits and n not in content_hits]
+
+        parts = []
+        for recipe_name in name_hits + content_hits + fuzzy_hits:
+            parts.append(f"Recipe filename: {recipe_name}\n")
+            parts.append(_pretty_recipe(recipe_name) + "\n")
+            parts.append("-" * 30 + "\n")
+
+        self._set_readonly_text(
+            self.search_results,
+            ''.join(parts) if parts else f"No recipes found matching '{search_term}'."
+        )
 
     def export_recipes(self):
         """Export recipes to a different file."""
@@ -1344,8 +2089,10 @@ class RecipeManagerApp:
             return
 
         try:
-            with open(filename, 'w') as file:
-                json.dump(recipes, file, indent=4)
+            # Single binary write of pre-serialized bytes (orjson-backed when
+            # available), atomic so an aborted export can't truncate an
+            # existing file
+            _write_file_atomic(filename, dumps_pretty(recipes))
 
             messagebox.showinfo("Success", f"Recipes exported successfully to {filename}.")
         except Exception as e:
@@ -1372,12 +2119,12 @@ def run_ipc() -> None:
         # Process IPC input
         handle_ipc_input()
     except Exception as e:
-        logging.error(f"Error in IPC mode: {str(e)}")
-        print(json.dumps({
+        logging.error("Error in IPC mode: %s", e)
+        _ipc_send({
             'action': 'error',
             'success': False,
             'error': f"IPC error: {str(e)}"
-        }))
+        })
     finally:
         # Ensure we perform cleanup
         handle_graceful_shutdown()
@@ -1386,7 +2133,8 @@ def run_ipc() -> None:
 
 def run_gui() -> None:
     """Run the graphical user interface version of the KubeJS Recipe Manager."""
-    # Check if Tkinter is available
+    # Check if Tkinter is available (importing it on demand)
+    _load_tkinter()
     if not TKINTER_AVAILABLE:
         logging.error("Tkinter is not available. Cannot run GUI mode.")
         print("Error: Tkinter is not available. Cannot run GUI mode.")
@@ -1398,36 +2146,28 @@ def run_gui() -> None:
         print("A GUI window should appear shortly.")
 
         root = tk.Tk()
+        app = RecipeManagerApp(root)
 
-        # Create a function to check if GUI is visible
-        def check_gui_visible():
-            response = input("Can you see the GUI window? (yes/no): ").strip().lower()
-            if response == 'yes':
-                print("Great! You can now use the GUI interface.")
-                # Continue with the application
-                app = RecipeManagerApp(root)
-                root.deiconify()  # Make sure the window is visible
-                root.mainloop()
-            elif response == 'no':
-                retry = input("Would you like to try again? (yes/no): ").strip().lower()
-                if retry == 'yes':
-                    print("Trying to display the GUI again...")
-                    root.deiconify()  # Try to make the window visible again
-                    check_gui_visible()
-                else:
-                    print("Falling back to CLI mode...")
-                    root.destroy()
-                    run_cli()
-            else:
-                print("Please answer 'yes' or 'no'.")
-                check_gui_visible()
+        fallback_to_cli = False
 
-        # Hide the root window initially
-        root.withdraw()
+        def verify_visible():
+            # Programmatic visibility check in place of the old blocking
+            # input() prompt, which froze the Tk event loop on stdin
+            nonlocal fallback_to_cli
+            if root.winfo_viewable():
+                return
+            fallback_to_cli = True
+            root.destroy()
 
-        # Start the check after a short delay to allow the window to be created
-        root.after(500, check_gui_visible)
+        root.deiconify()
+        # Give the window manager time to map the window, then verify
+        root.after(2000, verify_visible)
         root.mainloop()
+
+        if fallback_to_cli:
+            logging.error("GUI window never became viewable.")
+            print("The GUI window could not be displayed. Falling back to CLI mode...")
+            run_cli()
     except Exception as e:
         if TKINTER_AVAILABLE:
             messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
@@ -1442,44 +2182,129 @@ def run_gui() -> None:
 # IPC Mode Functions (for Electron frontend)
 # ==========================================
 
+# Flush after at most this many buffered responses even when more input
+# is already waiting
+_IPC_FLUSH_BATCH = 64
+_ipc_pending = 0
+
+# Parsed messages waiting for the dispatch loop; bounded so a burst of
+# requests applies back-pressure on the reader instead of growing memory
+_IPC_QUEUE_SIZE = 64
+_ipc_queue: Optional["queue.Queue"] = None
+
+def _ipc_input_ready() -> bool:
+    """Check whether another request is already waiting to be handled."""
+    if _ipc_queue is not None:
+        return not _ipc_queue.empty()
+    try:
+        return bool(select.select([sys.stdin], [], [], 0)[0])
+    except (OSError, ValueError):
+        # select doesn't work on pipes everywhere (e.g. Windows); flushing
+        # per message is the safe fallback
+        return False
+
+def _ipc_reader(in_queue: "queue.Queue") -> None:
+    """Read and parse stdin lines into the queue until the stream closes.
+
+    Runs on its own thread so slow handlers (disk writes, addon fetches)
+    overlap with reading and parsing the next requests. Parse errors are
+    queued too, keeping responses in request order; None marks EOF.
+    """
+    try:
+        for raw_line in sys.stdin.buffer:
+            if not raw_line.strip():
+                continue
+            try:
+                in_queue.put(('msg', loads_json(raw_line)))
+            except ValueError as e:
+                # Covers json.JSONDecodeError and orjson's equivalent
+                in_queue.put(('err', str(e)))
+    finally:
+        in_queue.put(None)
+
+def _ipc_send(response: Dict[str, Any]) -> None:
+    """Serialize a response and write it to stdout as one NDJSON line.
+
+    Goes through the shared dumps helper (orjson when available) and the
+    binary stdout stream, skipping print's str round-trip and encoding.
+    Flushing is deferred while more requests are already queued on stdin,
+    so a burst of messages costs one pipe flush instead of one each.
+    """
+    global _ipc_pending
+    out = sys.stdout.buffer
+    out.write(dumps_compact(response) + b'\n')
+    _ipc_pending += 1
+    if _ipc_pending >= _IPC_FLUSH_BATCH or not _ipc_input_ready():
+        out.flush()
+        _ipc_pending = 0
+
 def handle_ipc_input() -> None:
-    """Handle IPC input from stdin in JSON format."""
+    """Handle IPC input from stdin in JSON format.
+
+    A reader thread parses incoming lines into a bounded queue while this
+    loop runs the handlers and writes responses, so stdin keeps draining
+    during slow handlers. One dispatch loop preserves response order.
+    """
+    global _ipc_queue
+    _ipc_queue = queue.Queue(maxsize=_IPC_QUEUE_SIZE)
+    reader = threading.Thread(target=_ipc_reader, args=(_ipc_queue,),
+                              daemon=True)
+    reader.start()
     try:
         while True:
-            # Read a line from stdin (sent from Electron)
-            line = input()
-            
-            # Parse the JSON message
-            try:
-                message = json.loads(line)
-                action = message.get('action')
-                
-                if action == 'exit':
-                    logging.info("Received exit command. Shutting down...")
-                    break
-                    
-                # Process the message based on the action
-                response = process_ipc_message(message)
-                
-                # Send the response as JSON
-                print(json.dumps(response))
-                
-            except json.JSONDecodeError as e:
-                logging.error(f"Invalid JSON received: {e}")
-                print(json.dumps({
+            item = _ipc_queue.get()
+            if item is None:
+                # End of input stream (Electron closed)
+                logging.info("Input stream closed. Shutting down...")
+                return
+
+            kind, payload = item
+            if kind == 'err':
+                logging.error("Invalid JSON received: %s", payload)
+                _ipc_send({
                     'success': False,
-                    'error': f"Invalid JSON: {str(e)}"
-                }))
-                
-    except EOFError:
-        # End of input stream (Electron closed)
-        logging.info("Input stream closed. Shutting down...")
+                    'error': f"Invalid JSON: {payload}"
+                })
+                continue
+
+            message = payload
+            if message.get('action') == 'exit':
+                logging.info("Received exit command. Shutting down...")
+                return
+
+            # Process the message based on the action
+            response = process_ipc_message(message)
+
+            # Send the response as JSON
+            _ipc_send(response)
     except Exception as e:
-        logging.error(f"Error in IPC mode: {str(e)}")
-        print(json.dumps({
+        logging.error("Error in IPC mode: %s", e)
+        _ipc_send({
             'success': False,
             'error': f"IPC error: {str(e)}"
-        }))
+        })
+    finally:
+        # Make sure nothing buffered is lost when the loop ends
+        sys.stdout.buffer.flush()
+
+# Canned responses for expected validation failures, so rejecting a bad
+# client call does not build a fresh dict literal each time. Handlers
+# return a shallow copy in case the caller mutates the response.
+_ERR_SAVE_NAME_REQUIRED = {
+    'action': 'recipe_saved',
+    'success': False,
+    'error': "Recipe name is required"
+}
+_ERR_DELETE_NAME_REQUIRED = {
+    'action': 'recipe_deleted',
+    'success': False,
+    'error': "Recipe name is required"
+}
+_ERR_SEARCH_TERM_REQUIRED = {
+    'action': 'search_results',
+    'success': False,
+    'error': "Search term is required"
+}
 
 def process_ipc_message(message: Dict[str, Any]) -> Dict[str, Any]:
     """Process an IPC message and return a response.
@@ -1491,31 +2316,26 @@ def process_ipc_message(message: Dict[str, Any]) -> Dict[str, Any]:
         Dict[str, Any]: The response message
     """
     action = message.get('action')
-    logging.info(f"Processing IPC message: {action}")
-    
-    # Map actions to handler functions
-    handlers = {
-        'load_recipes': handle_load_recipes,
-        'save_recipe': handle_save_recipe,
-        'delete_recipe': handle_delete_recipe,
-        'search_recipes': handle_search_recipes,
-        'export_recipes': handle_export_recipes,
-        'fetch_addons': handle_fetch_addons
-    }
+    # Actions come from a fixed vocabulary; interning makes the table
+    # lookup below a pointer comparison against the literal keys
+    if type(action) is str:
+        action = sys.intern(action)
+    logging.info("Processing IPC message: %s", action)
     
     # Call the appropriate handler or return an error
-    if action in handlers:
+    handler = _IPC_HANDLERS.get(action)
+    if handler is not None:
         try:
-            return handlers[action](message)
+            return handler(message)
         except Exception as e:
-            logging.error(f"Error handling {action}: {str(e)}")
+            logging.error("Error handling %s: %s", action, e)
             return {
                 'action': f"{action}_error",
                 'success': False,
                 'error': str(e)
             }
     else:
-        logging.warning(f"Unknown action: {action}")
+        logging.warning("Unknown action: %s", action)
         return {
             'action': 'unknown_action',
             'success': False,
@@ -1534,14 +2354,30 @@ def handle_load_recipes(message: Dict[str, Any]) -> Dict[str, Any]:
     try:
         # Load recipes
         load_recipes()
-        
+
+        # With 'stream': True, emit one line per recipe followed by a
+        # summary, so the frontend can render progressively and no single
+        # serialization has to cover the whole collection
+        if message.get('stream'):
+            for name, recipe in recipes.items():
+                _ipc_send({
+                    'action': 'recipes_loaded_chunk',
+                    'name': name,
+                    'recipe': recipe
+                })
+            return {
+                'action': 'recipes_loaded',
+                'success': True,
+                'count': len(recipes)
+            }
+
         return {
             'action': 'recipes_loaded',
             'success': True,
             'recipes': recipes
         }
     except Exception as e:
-        logging.error(f"Error loading recipes: {str(e)}")
+        logging.error("Error loading recipes: %s", e)
         return {
             'action': 'recipes_loaded',
             'success': False,
@@ -1563,17 +2399,16 @@ def handle_save_recipe(message: Dict[str, Any]) -> Dict[str, Any]:
         is_new = message.get('isNew', True)
         
         if not recipe_name:
-            return {
-                'action': 'recipe_saved',
-                'success': False,
-                'error': "Recipe name is required"
-            }
+            return dict(_ERR_SAVE_NAME_REQUIRED)
             
         # Add or update the recipe
         recipes[recipe_name] = recipe_data
-        
-        # Save all recipes
-        if save_recipes():
+        _index_recipe(recipe_name, recipe_data)
+
+        # Journal the single change; fall back to a full save if the
+        # WAL cannot be written
+        if _wal_append({'op': 'put', 'name': recipe_name,
+                        'recipe': recipe_data}) or save_recipes():
             return {
                 'action': 'recipe_saved',
                 'success': True,
@@ -1587,7 +2422,7 @@ def handle_save_recipe(message: Dict[str, Any]) -> Dict[str, Any]:
                 'error': "Failed to save recipes"
             }
     except Exception as e:
-        logging.error(f"Error saving recipe: {str(e)}")
+        logging.error("Error saving recipe: %s", e)
         return {
             'action': 'recipe_saved',
             'success': False,
@@ -1607,11 +2442,7 @@ def handle_delete_recipe(message: Dict[str, Any]) -> Dict[str, Any]:
         recipe_name = message.get('recipeName')
         
         if not recipe_name:
-            return {
-                'action': 'recipe_deleted',
-                'success': False,
-                'error': "Recipe name is required"
-            }
+            return dict(_ERR_DELETE_NAME_REQUIRED)
             
         if recipe_name not in recipes:
             return {
@@ -1622,9 +2453,11 @@ def handle_delete_recipe(message: Dict[str, Any]) -> Dict[str, Any]:
             
         # Delete the recipe
         del recipes[recipe_name]
-        
-        # Save all recipes
-        if save_recipes():
+        _unindex_recipe(recipe_name)
+
+        # Journal the single change; fall back to a full save if the
+        # WAL cannot be written
+        if _wal_append({'op': 'del', 'name': recipe_name}) or save_recipes():
             return {
                 'action': 'recipe_deleted',
                 'success': True,
@@ -1637,7 +2470,7 @@ def handle_delete_recipe(message: Dict[str, Any]) -> Dict[str, Any]:
                 'error': "Failed to save recipes after deletion"
             }
     except Exception as e:
-        logging.error(f"Error deleting recipe: {str(e)}")
+        logging.error("Error deleting recipe: %s", e)
         return {
             'action': 'recipe_deleted',
             'success': False,
@@ -1657,27 +2490,31 @@ def handle_search_recipes(message: Dict[str, Any]) -> Dict[str, Any]:
         search_term = message.get('searchTerm', '').lower()
         
         if not search_term:
-            return {
-                'action': 'search_results',
-                'success': False,
-                'error': "Search term is required"
-            }
-        
-        # Search in recipe names, types, outputs, and ingredients
-        results = []
+            return dict(_ERR_SEARCH_TERM_REQUIRED)
         
-        for name, recipe in recipes.items():
-            recipe_json = json.dumps(recipe).lower()
-            if (search_term in name.lower() or 
-                search_term in recipe.get('type', '').lower() or
-                search_term in recipe.get('output', '').lower() or
-                search_term in recipe_json):
-                
-                results.append({
-                    'name': name,
-                    'recipe': recipe
-                })
-                
+        # Search in recipe names, types, outputs, and ingredients. Multiple
+        # space/comma-separated terms compile into one alternation pattern
+        # so each blob is scanned once for all of them; pure alphanumeric
+        # terms resolve through the inverted token index (a vocabulary scan
+        # plus posting-list union gives exactly the substring-scan results);
+        # anything else falls back to the precomputed blobs.
+        terms = [t for t in re.split(r'[\s,]+', search_term) if t]
+        if len(terms) > 1:
+            pattern = re.compile('|'.join(map(re.escape, terms)))
+            matched = [name for name, blob in _search_blobs.items()
+                       if pattern.search(blob)]
+        elif _TOKEN_RE.fullmatch(search_term):
+            hits = set()
+            for token, posting in _token_index.items():
+                if search_term in token:
+                    hits.update(posting)
+            matched = [name for name in _search_blobs if name in hits]
+        else:
+            matched = _matching_recipe_names(search_term)
+
+        results = [{'name': name, 'recipe': recipes[name]}
+                   for name in matched]
+
         return {
             'action': 'search_results',
             'success': True,
@@ -1685,7 +2522,7 @@ def handle_search_recipes(message: Dict[str, Any]) -> Dict[str, Any]:
             'searchTerm': search_term
         }
     except Exception as e:
-        logging.error(f"Error searching recipes: {str(e)}")
+        logging.error("Error searching recipes: %s", e)
         return {
             'action': 'search_results',
             'success': False,
@@ -1711,9 +2548,8 @@ def handle_export_recipes(message: Dict[str, Any]) -> Dict[str, Any]:
                 'error': "File path is required"
             }
         
-        # Write the recipes to the file
-        with open(file_path, 'w') as file:
-            json.dump(recipes, file, indent=4)
+        # Serialize once and write the bytes atomically in a single call
+        _write_file_atomic(file_path, dumps_pretty(recipes))
             
         return {
             'action': 'recipes_exported',
@@ -1721,7 +2557,7 @@ def handle_export_recipes(message: Dict[str, Any]) -> Dict[str, Any]:
             'filePath': file_path
         }
     except Exception as e:
-        logging.error(f"Error exporting recipes: {str(e)}")
+        logging.error("Error exporting recipes: %s", e)
         return {
             'action': 'recipes_exported',
             'success': False,
@@ -1736,77 +2572,63 @@ def handle_graceful_shutdown() -> None:
     try:
         save_recipes()
     except Exception as e:
-        logging.error(f"Error saving recipes during shutdown: {str(e)}")
+        logging.error("Error saving recipes during shutdown: %s", e)
         
     # Close any open files or connections
     logging.info("Shutdown complete")
 
-def handle_graceful_shutdown() -> None:
-    """Perform graceful shutdown tasks."""
-    logging.info("Performing graceful shutdown...")
-    
-    # Save any unsaved data if needed
-    try:
-        save_recipes()
-    except Exception as e:
-        logging.error(f"Error saving recipes during shutdown: {str(e)}")
-        
-    # Close any open files or connections
-    logging.info("Shutdown complete")
+def handle_fetch_addons(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch KubeJS addons and return them.
 
-def handle_export_recipes(message: Dict[str, Any]) -> Dict[str, Any]:
-    """Export recipes to a file.
-    
     Args:
-        message (Dict[str, Any]): The message with export options
-        
+        message (Dict[str, Any]): The message requesting addons
+
     Returns:
-        Dict[str, Any]: The response indicating success or failure
+        Dict[str, Any]: The response with addons
     """
     try:
-        file_path = message.get('filePath')
-        
-        if not file_path:
+        addons = fetch_kubejs_addons()
+
+        if addons:
             return {
-                'action': 'recipes_exported',
-                'success': False,
-                'error': "File path is required"
+                'action': 'addons_fetched',
+                'success': True,
+                'addons': addons
             }
-        
-        # Write the recipes to the file
-        with open(file_path, 'w') as file:
-            json.dump(recipes, file, indent=4)
-            
+
+        fallback_addons = get_fallback_addons()
         return {
-            'action': 'recipes_exported',
+            'action': 'addons_fetched',
             'success': True,
-            'filePath': file_path
+            'addons': fallback_addons,
+            'warning': "Could not fetch addons from web or database, using fallback data"
         }
     except Exception as e:
-        logging.error(f"Error exporting recipes: {str(e)}")
-        return {
-            'action': 'recipes_exported',
-            'success': False,
-            'error': str(e)
-        }
-
-# This duplicate section is removed - the original implementation is kept above
+        logging.error("Error fetching addons: %s", e)
+        # Always return some data, even on error
+        try:
+            fallback_addons = get_fallback_addons()
+            return {
+                'action': 'addons_fetched',
+                'success': True,
                 'addons': fallback_addons,
                 'warning': f"Error fetching addons: {str(e)}. Using fallback data."
             }
         except Exception as inner_e:
-            logging.error(f"Error getting fallback addons: {str(inner_e)}")
+            logging.error("Error getting fallback addons: %s", inner_e)
             return {
-                'action': 'addons_fetched',
                 'action': 'addons_fetched',
                 'success': False,
                 'error': f"Error fetching addons: {str(e)}. Fallback also failed: {str(inner_e)}"
             }
-                'warning': "Could not fetch addons from web or database, using fallback data"
-            }
-    except Exception as e:
-        logging.error(f"Error fetching addons: {str(e)}")
-        # Always return some data, even on error
-        try:
-            fallback_addons = get_fallback_addons()
-            return {
+
+# Action dispatch table, built once all handlers are defined so
+# process_ipc_message does a single dict lookup per message
+_IPC_HANDLERS = {
+    'load_recipes': handle_load_recipes,
+    'save_recipe': handle_save_recipe,
+    'delete_recipe': handle_delete_recipe,
+    'search_recipes': handle_search_recipes,
+    'export_recipes': handle_export_recipes,
+    'fetch_addons': handle_fetch_addons
+}